@@ -5,9 +5,79 @@ Enables recursive searching through pack contents to find nested presets.
 """
 
 from typing import Tuple, Any, List
+from array import array
+from collections import deque
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import chain, islice
+import re
+import time
 import Live
 from .handler import AbletonOSCHandler
 
+# Seconds before the cached browser index is considered stale and rebuilt
+BROWSER_INDEX_TTL = 300.0
+
+# Seconds before cached top-level browser listings are re-read from Live
+BROWSER_LISTING_TTL = 60.0
+
+# Number of browser records read per Live tick when building the index in the background
+BROWSER_INDEX_STEP_SIZE = 500
+
+# Max folder depth walked below each pack / browser location when indexing
+BROWSER_INDEX_MAX_DEPTH = 10
+
+# Max number of distinct names whose prefix matches are collected and sorted; prefixes
+# shared by more names than this are scanned lazily from the name blob instead
+BROWSER_PREFIX_COLLECT_LIMIT = 256
+
+
+class NodeRecord:
+    """Snapshot of a Live BrowserItem.
+
+    Each property is read across the Live bridge once, when the record is created.
+    `children` is None until the record has been expanded; `children_by_name` maps
+    each lowercased child name to the first child with that name.
+    """
+    __slots__ = ("name", "name_lower", "is_loadable", "is_folder", "children", "children_by_name", "item_ref")
+
+    def __init__(self, item):
+        name = item.name
+        self.name = name
+        self.name_lower = name.lower()
+        self.is_loadable = item.is_loadable
+        self.is_folder = item.is_folder
+        self.children = None
+        self.children_by_name = {}
+        self.item_ref = item
+
+    def set_children(self, children):
+        self.children = children
+        # Built in reverse so that the first child with a given name wins
+        self.children_by_name = {child.name_lower: child for child in reversed(children)}
+
+
+class BrowserIndex:
+    """Browser index structures, built off to the side and then installed on the
+    BrowserHandler in one step. See BrowserHandler.init_api for the fields."""
+    __slots__ = ("name_index", "sorted_names", "name_trigrams", "entry_records", "entry_names_lower", "entry_rel_paths", "entry_roots", "entry_depths", "pack_records", "pack_lookup", "location_records", "root_names", "name_blob", "name_offsets")
+
+    def __init__(self):
+        self.name_index = {}
+        self.sorted_names = []
+        self.name_trigrams = set()
+        self.entry_records = []
+        self.entry_names_lower = []
+        self.entry_rel_paths = []
+        self.entry_roots = array("i")
+        self.entry_depths = array("i")
+        self.pack_records = []
+        self.pack_lookup = {}
+        self.location_records = []
+        self.root_names = []
+        self.name_blob = b""
+        self.name_offsets = array("i")
+
 
 class BrowserHandler(AbletonOSCHandler):
     def __init__(self, manager):
@@ -18,6 +88,402 @@ class BrowserHandler(AbletonOSCHandler):
         application = Live.Application.get_application()
         browser = application.browser
 
+        # =============================================================================
+        # Browser Index
+        # =============================================================================
+        #
+        # Walking the Live browser crosses the Python/Live bridge for every
+        # iter_children, name, is_loadable and is_folder access. The browser is
+        # therefore read once into a tree of NodeRecords, and searches are served
+        # from indexes over it:
+        #
+        #   _pack_records:     NodeRecord for each pack
+        #   _pack_lookup:      lowercased pack name -> first pack record with that name
+        #   _location_records: NodeRecord for each standard browser location
+        #   _root_names:       names of the packs, followed by the locations
+        #
+        # Loadable items are stored column-wise in browser order:
+        #
+        #   _entry_records:     NodeRecord of the item
+        #   _entry_names_lower: lowercased item name
+        #   _entry_rel_paths:   path relative to the root, starting with "/"; the
+        #                       root name is prefixed only when formatting output
+        #   _entry_roots:       index into _root_names; packs come first, so an item
+        #                       is in a pack if its root < len(_pack_records)
+        #   _entry_depths:      folder depth below the root, from 1
+        #
+        #   _name_index:        name_lower -> list of entry indices with that name
+        #   _sorted_names:      keys of _name_index in sorted order, so that the names
+        #                       starting with a prefix are a contiguous bisect range
+        #   _name_blob:         all of _entry_names_lower as UTF-8, joined by newlines,
+        #                       so that substring search is a run of bytes.find calls
+        #   _name_offsets:      byte offset of each entry's name within _name_blob
+        #   _name_trigrams:     every 3-character substring of an indexed name, so
+        #                       queries that cannot match are rejected up front
+        #
+        # Live's embedded Python does not support threads, so the index is built
+        # in the background as a generator stepped once per Live tick
+        # (_index_builder), into a fresh BrowserIndex that is installed when
+        # complete. This happens at startup, when the index is older than
+        # BROWSER_INDEX_TTL, and on /live/browser/invalidate_cache; until then the
+        # previous index keeps serving queries. Only a query that arrives before
+        # any index exists finishes the build synchronously, as does
+        # /live/browser/refresh.
+
+        self._index_built_at = None
+        self._index_builder = None
+
+        def _install_index(index):
+            """Replace the handler's index structures with those of a BrowserIndex."""
+            self._name_index = index.name_index
+            self._sorted_names = index.sorted_names
+            self._name_trigrams = index.name_trigrams
+            self._entry_records = index.entry_records
+            self._entry_names_lower = index.entry_names_lower
+            self._entry_rel_paths = index.entry_rel_paths
+            self._entry_roots = index.entry_roots
+            self._entry_depths = index.entry_depths
+            self._pack_records = index.pack_records
+            self._pack_lookup = index.pack_lookup
+            self._location_records = index.location_records
+            self._root_names = index.root_names
+            self._name_blob = index.name_blob
+            self._name_offsets = index.name_offsets
+
+        _install_index(BrowserIndex())
+
+        def _record_children(record):
+            """Return the child records of a record, reading them from Live on first access.
+
+            This is the only loop that reads browser items across the Live bridge.
+            """
+            if record.children is None:
+                children = []
+                append = children.append
+                try:
+                    for item in record.item_ref.iter_children:
+                        append(NodeRecord(item))
+                except Exception as e:
+                    self.logger.debug("Error iterating children of %s: %s", record.name, e)
+                record.set_children(children)
+            return record.children
+
+        def _walk(record, max_depth, prefix=""):
+            """Yield (path_parts, record, depth) for each record below record, depth-first
+            in browser order, down to max_depth levels.
+
+            path_parts is a single list of names, starting with prefix, that is
+            appended to and popped as the walk descends and returns, so
+            "/".join(path_parts) is the record's path; with the default prefix it is
+            relative to record and starts with "/". The list is only valid until the
+            walk advances, so join it before taking the next item.
+
+            Uses an explicit stack of child iterators rather than recursing per
+            folder, and reads children from Live only as the walk reaches them, so
+            consumers can stop early.
+            """
+            if max_depth <= 0:
+                return
+
+            path_parts = [prefix]
+            stack = deque([iter(self._record_children(record))])
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    path_parts.pop()
+                    continue
+
+                depth = len(stack)
+                path_parts.append(child.name)
+                yield path_parts, child, depth
+                if child.is_folder and depth < max_depth:
+                    stack.append(iter(self._record_children(child)))
+                else:
+                    path_parts.pop()
+
+        def _index_item(record, root_id, index):
+            """Read the tree below a root record and add its loadable descendants to index.
+
+            Yields after each record is read, so that the build can be stepped.
+            """
+            for path_parts, child, depth in _walk(record, BROWSER_INDEX_MAX_DEPTH):
+                yield
+                if not child.is_loadable:
+                    continue
+                name_lower = child.name_lower
+                entry_id = len(index.entry_records)
+                index.entry_records.append(child)
+                index.entry_names_lower.append(name_lower)
+                index.entry_rel_paths.append("/".join(path_parts))
+                index.entry_roots.append(root_id)
+                index.entry_depths.append(depth)
+                if name_lower not in index.name_index:
+                    index.name_index[name_lower] = []
+                    index.name_trigrams.update(name_lower[j:j + 3] for j in range(len(name_lower) - 2))
+                index.name_index[name_lower].append(entry_id)
+
+        def _build_index_steps():
+            """Build a new browser index from packs and the standard browser locations,
+            and install it once complete.
+
+            Generator that yields after each Live record is read.
+            """
+            index = BrowserIndex()
+            index.pack_records = [NodeRecord(pack) for pack in browser.packs.iter_children]
+            index.pack_lookup = {record.name_lower: record for record in reversed(index.pack_records)}
+            index.location_records = [NodeRecord(location) for location in [
+                browser.instruments,
+                browser.audio_effects,
+                browser.midi_effects,
+                browser.drums,
+                browser.sounds,
+            ]]
+
+            root_records = index.pack_records + index.location_records
+            index.root_names = [record.name for record in root_records]
+            for root_id, record in enumerate(root_records):
+                yield from _index_item(record, root_id, index)
+
+            index.sorted_names = sorted(index.name_index)
+            names_utf8 = [name_lower.encode("utf-8", "replace") for name_lower in index.entry_names_lower]
+            index.name_blob = b"\n".join(names_utf8)
+            offset = 0
+            for name_utf8 in names_utf8:
+                index.name_offsets.append(offset)
+                offset += len(name_utf8) + 1
+
+            _install_index(index)
+            self._index_built_at = time.monotonic()
+            self.logger.info("Indexed %d loadable browser items", len(index.entry_records))
+
+        def _build_index():
+            """Rebuild the browser index synchronously, abandoning any background build."""
+            self._index_builder = None
+            deque(_build_index_steps(), maxlen=0)
+
+        def _start_index_build():
+            """Start rebuilding the browser index in the background, one step per tick."""
+            builder = _build_index_steps()
+            self._index_builder = builder
+            self.manager.schedule_message(1, partial(_step_index_build, builder))
+
+        def _step_index_build(builder):
+            """Run one tick's worth of a background index build, rescheduling until done.
+
+            Stops if builder has been finished or replaced in the meantime. Called from
+            Live's scheduler, outside any OSC handler, so errors are logged here and
+            abandon the build rather than propagating.
+            """
+            if builder is not self._index_builder:
+                return
+            try:
+                steps = sum(1 for _ in islice(builder, BROWSER_INDEX_STEP_SIZE))
+            except Exception as e:
+                self.logger.error("Error building browser index: %s", e)
+                self._index_builder = None
+                return
+            if steps < BROWSER_INDEX_STEP_SIZE:
+                self._index_builder = None
+            else:
+                self.manager.schedule_message(1, partial(_step_index_build, builder))
+
+        def _ensure_index():
+            """Make sure there is a browser index to serve, and refresh it if stale.
+
+            If no index has been built yet, finishes a background build in progress
+            (or builds from scratch) before returning. A stale index is rebuilt in the
+            background, and keeps serving queries until the new one is installed.
+            """
+            if self._index_built_at is None:
+                builder = self._index_builder
+                self._index_builder = None
+                if builder is not None:
+                    deque(builder, maxlen=0)
+                if self._index_built_at is None:
+                    _build_index()
+            elif self._index_builder is None and time.monotonic() - self._index_built_at > BROWSER_INDEX_TTL:
+                _start_index_build()
+
+        def _prefix_matches(query):
+            """Return an iterable of indices of entries whose lowercased name starts with
+            query, in browser order.
+
+            The distinct names starting with query are found by bisecting
+            _sorted_names. If there are few of them, their entries are collected and
+            sorted; otherwise the prefix matches are produced lazily by _prefix_scan,
+            so that short queries don't collect most of the index up front.
+            """
+            names = self._sorted_names
+            start = bisect_left(names, query)
+            end = start
+            limit = min(start + BROWSER_PREFIX_COLLECT_LIMIT + 1, len(names))
+            while end < limit and names[end].startswith(query):
+                end += 1
+
+            if end - start > BROWSER_PREFIX_COLLECT_LIMIT:
+                return _prefix_scan(query)
+
+            matches = []
+            for name_lower in names[start:end]:
+                matches.extend(self._name_index[name_lower])
+            matches.sort()
+            return matches
+
+        def _find_child(record, name):
+            """Return the child record matching name, or None.
+
+            Children whose name equals name case-insensitively are found by dict lookup;
+            otherwise falls back to the first child whose name contains it.
+            """
+            name_lower = name.lower()
+            children = self._record_children(record)
+            child = record.children_by_name.get(name_lower)
+            if child is not None:
+                return child
+            for child in children:
+                if name_lower in child.name_lower:
+                    return child
+            return None
+
+        def _blob_matches(find):
+            """Yield indices of entries whose name contains a match, in browser order.
+
+            find(pos) returns the offset of the next match in _name_blob at or after
+            pos, or -1. After each hit the scan skips to the start of the next name.
+            """
+            offsets = self._name_offsets
+            if not offsets:
+                return
+
+            pos = find(0)
+            while pos >= 0:
+                i = bisect_right(offsets, pos) - 1
+                yield i
+                if i + 1 >= len(offsets):
+                    return
+                pos = find(offsets[i + 1])
+
+        def _substring_matches(query):
+            """Yield indices of entries whose lowercased name contains query, in browser order."""
+            if "\n" in query:
+                return iter(())
+            return _blob_matches(partial(self._name_blob.find, query.encode("utf-8", "replace")))
+
+        def _prefix_scan(query):
+            """Yield indices of entries whose lowercased name starts with query, in browser
+            order, by scanning _name_blob for the query following a newline."""
+            blob = self._name_blob
+            query_utf8 = query.encode("utf-8", "replace")
+            anchored = b"\n" + query_utf8
+
+            def find(pos):
+                if pos == 0 and blob.startswith(query_utf8):
+                    return 0
+                # Names start just after a newline, so search from the one before pos
+                match = blob.find(anchored, max(pos - 1, 0))
+                return match + 1 if match >= 0 else -1
+
+            return _blob_matches(find)
+
+        def _multi_substring_matches(queries):
+            """Yield indices of entries whose lowercased name contains any of queries, in
+            browser order.
+
+            The queries are compiled into a single regex alternation, so the blob is
+            scanned once however many queries there are.
+            """
+            queries = [query for query in queries if "\n" not in query]
+            if not queries:
+                return iter(())
+            pattern = re.compile(b"|".join(re.escape(query.encode("utf-8", "replace")) for query in queries))
+            blob = self._name_blob
+
+            def find(pos):
+                match = pattern.search(blob, pos)
+                return match.start() if match else -1
+
+            return _blob_matches(find)
+
+        def _may_match(query):
+            """Return False if no indexed name can contain query, judged by its trigrams."""
+            trigrams = self._name_trigrams
+            return all(query[j:j + 3] in trigrams for j in range(len(query) - 2))
+
+        def _find_pack(pack_name):
+            """Return the record of the pack matching pack_name, or None.
+
+            A pack whose name equals pack_name case-insensitively is found by dict
+            lookup; otherwise falls back to the first pack whose name contains it.
+            """
+            pack_name_lower = pack_name.lower()
+            record = self._pack_lookup.get(pack_name_lower)
+            if record is not None:
+                return record
+            return next((record for record in self._pack_records
+                         if pack_name_lower in record.name_lower), None)
+
+        def browser_refresh(_):
+            """Rebuild the browser index.
+
+            Returns (item_count,) with the number of indexed loadable items.
+            """
+            _build_index()
+            return (len(self._entry_records),)
+
+        self._build_index = _build_index
+        self._ensure_index = _ensure_index
+        self._record_children = _record_children
+        self._walk = _walk
+        self._prefix_matches = _prefix_matches
+        self._find_child = _find_child
+        self._substring_matches = _substring_matches
+        self._multi_substring_matches = _multi_substring_matches
+        self._may_match = _may_match
+        self._find_pack = _find_pack
+        self.osc_server.add_handler("/live/browser/refresh", browser_refresh)
+
+        _start_index_build()
+
+        # =============================================================================
+        # Top-Level Listing Cache
+        # =============================================================================
+        #
+        # The browser_list_* handlers are polled repeatedly by clients, and their
+        # results rarely change within a session. Listings are cached per browser
+        # location as (timestamp, names), and re-read after BROWSER_LISTING_TTL or
+        # on /live/browser/invalidate_cache.
+
+        self._top_level_cache = {}
+
+        def _list_top_level(key, root, description):
+            """Return the names of the top-level items below root, cached under key."""
+            cached = self._top_level_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] <= BROWSER_LISTING_TTL:
+                return cached[1]
+
+            try:
+                names = tuple(item.name for item in root.iter_children)
+            except Exception as e:
+                self.logger.error("Error listing %s: %s", description, e)
+                return ()
+
+            self._top_level_cache[key] = (time.monotonic(), names)
+            return names
+
+        def browser_invalidate_cache(_):
+            """Discard cached listings and rebuild the browser index.
+
+            Listings are re-read from Live the next time they are needed. The index is
+            rebuilt in the background, and the current one serves queries until then.
+            """
+            self._top_level_cache = {}
+            _start_index_build()
+            self.logger.info("Invalidated browser cache")
+
+        self._list_top_level = _list_top_level
+        self.osc_server.add_handler("/live/browser/invalidate_cache", browser_invalidate_cache)
+
         # =============================================================================
         # List Packs
         # =============================================================================
@@ -27,15 +493,9 @@ class BrowserHandler(AbletonOSCHandler):
 
             Returns tuple of pack names.
             """
-            try:
-                pack_names = []
-                for pack in browser.packs.iter_children:
-                    pack_names.append(pack.name)
-                self.logger.info("Found %d packs" % len(pack_names))
-                return tuple(pack_names)
-            except Exception as e:
-                self.logger.error("Error listing packs: %s" % str(e))
-                return ()
+            pack_names = self._list_top_level("packs", browser.packs, "packs")
+            self.logger.info("Found %d packs", len(pack_names))
+            return pack_names
 
         self.osc_server.add_handler("/live/browser/list_packs", browser_list_packs)
 
@@ -59,39 +519,18 @@ class BrowserHandler(AbletonOSCHandler):
             pack_name = str(params[0])
             max_depth = int(params[1]) if len(params) > 1 else 10
 
-            # Find the pack
-            target_pack = None
-            for pack in browser.packs.iter_children:
-                if pack.name == pack_name or pack_name.lower() in pack.name.lower():
-                    target_pack = pack
-                    break
+            self._ensure_index()
+            target_pack = self._find_pack(pack_name)
 
             if not target_pack:
-                self.logger.warning("Pack not found: %s" % pack_name)
+                self.logger.warning("Pack not found: %s", pack_name)
                 return ()
 
-            results = []
-            self._collect_loadable_items(target_pack, "", results, max_depth)
-            self.logger.info("Found %d loadable items in pack '%s'" % (len(results), pack_name))
+            results = ["/".join(path_parts) for path_parts, record, _ in self._walk(target_pack, max_depth, target_pack.name)
+                       if record.is_loadable]
+            self.logger.info("Found %d loadable items in pack '%s'", len(results), pack_name)
             return tuple(results)
 
-        def _collect_loadable_items(item, path, results, depth):
-            """Recursively collect loadable items from a browser item."""
-            if depth <= 0:
-                return
-
-            current_path = path + "/" + item.name if path else item.name
-
-            try:
-                for child in item.iter_children:
-                    if child.is_loadable:
-                        results.append(current_path + "/" + child.name)
-                    if child.is_folder:
-                        _collect_loadable_items(child, current_path, results, depth - 1)
-            except Exception as e:
-                self.logger.debug("Error iterating children of %s: %s" % (current_path, str(e)))
-
-        self._collect_loadable_items = _collect_loadable_items
         self.osc_server.add_handler("/live/browser/list_pack_contents", browser_list_pack_contents)
 
         # =============================================================================
@@ -106,7 +545,11 @@ class BrowserHandler(AbletonOSCHandler):
                 params[1]: (optional) Max results, default 50
                 params[2]: (optional) Max depth for recursion, default 10
 
-            Returns tuple of (name, pack_name) pairs for matching items.
+            Returns tuple of "item_name|pack_name|path" strings for matching items.
+            Names starting with the query come first, then names with a word starting
+            with it, then other substring matches. Items deeper than
+            BROWSER_INDEX_MAX_DEPTH are not indexed; when max_depth exceeds it, they
+            follow the indexed matches, in browser order.
             """
             if len(params) < 1:
                 self.logger.warning("search requires query string")
@@ -116,45 +559,113 @@ class BrowserHandler(AbletonOSCHandler):
             max_results = int(params[1]) if len(params) > 1 else 50
             max_depth = int(params[2]) if len(params) > 2 else 10
 
-            results = []
-
-            # Search through all packs
-            for pack in browser.packs.iter_children:
-                if len(results) >= max_results:
-                    break
-                self._search_item(pack, query, results, max_results, max_depth, pack.name)
+            self._ensure_index()
 
             # Flatten results to tuple of strings: "item_name|pack_name|path"
-            output = []
-            for item_name, pack_name, path in results:
-                output.append("%s|%s|%s" % (item_name, pack_name, path))
+            matches = map(self._format_entry, self._gen_matches(query, max_depth))
+            if max_depth > BROWSER_INDEX_MAX_DEPTH:
+                matches = chain(matches, self._gen_deep_matches(query, max_depth))
+            output = tuple(islice(matches, max(max_results, 0)))
+
+            self.logger.info("Found %d items matching '%s'", len(output), query)
+            return output
+
+        def _gen_matches(query, depth):
+            """Yield indices of indexed pack items whose name contains query, best first.
+
+            Matches are ranked in three tiers, each in browser order:
+              1. names starting with the query, found by bisecting the sorted names
+                 (or a lazy blob scan when the prefix is shared by many names)
+              2. names with a word (after a space) starting with the query
+              3. names containing the query anywhere else
+            Matches are produced lazily, so when the first tier fills the caller's
+            quota the later scans never run.
+            """
+            if not self._may_match(query):
+                return
 
-            self.logger.info("Found %d items matching '%s'" % (len(output), query))
-            return tuple(output)
+            pack_count = len(self._pack_records)
+            roots = self._entry_roots
+            depths = self._entry_depths
 
-        def _search_item(item, query, results, max_results, depth, pack_name, path=""):
-            """Recursively search browser items for matching names."""
-            if depth <= 0 or len(results) >= max_results:
-                return
+            seen = set()
 
-            current_path = path + "/" + item.name if path else item.name
+            def unseen(matches):
+                for i in matches:
+                    if i not in seen:
+                        seen.add(i)
+                        yield i
 
-            try:
-                for child in item.iter_children:
-                    if len(results) >= max_results:
-                        break
+            prefix_matches = unseen(self._prefix_matches(query))
+            word_start_matches = unseen(self._substring_matches(" " + query))
+            substring_matches = unseen(self._substring_matches(query))
 
-                    if child.is_loadable and query in child.name.lower():
-                        results.append((child.name, pack_name, current_path + "/" + child.name))
+            for candidates in (prefix_matches, word_start_matches, substring_matches):
+                for i in candidates:
+                    if roots[i] < pack_count and depths[i] <= depth:
+                        yield i
 
-                    if child.is_folder:
-                        _search_item(child, query, results, max_results, depth - 1, pack_name, current_path)
-            except Exception as e:
-                self.logger.debug("Error searching %s: %s" % (current_path, str(e)))
+        def _gen_deep_matches(query, max_depth):
+            """Yield "item_name|pack_name|path" strings for pack items below
+            BROWSER_INDEX_MAX_DEPTH whose name contains query, in browser order.
 
-        self._search_item = _search_item
+            Walks the pack records directly, reading unindexed folders from Live as
+            the walk reaches them.
+            """
+            for pack in self._pack_records:
+                for path_parts, record, depth in self._walk(pack, max_depth, pack.name):
+                    if depth > BROWSER_INDEX_MAX_DEPTH and record.is_loadable and query in record.name_lower:
+                        yield "%s|%s|%s" % (record.name, pack.name, "/".join(path_parts))
+
+        def _format_entry(i):
+            """Format an indexed item as an "item_name|pack_name|path" string."""
+            root_name = self._root_names[self._entry_roots[i]]
+            return "%s|%s|%s%s" % (self._entry_records[i].name, root_name, root_name, self._entry_rel_paths[i])
+
+        self._gen_matches = _gen_matches
+        self._gen_deep_matches = _gen_deep_matches
+        self._format_entry = _format_entry
         self.osc_server.add_handler("/live/browser/search", browser_search)
 
+        # =============================================================================
+        # Search Browser for Multiple Terms (All Packs)
+        # =============================================================================
+
+        def browser_search_multi(params: Tuple[Any]):
+            """Search all packs for items matching any of several queries.
+
+            Args:
+                params[0]: Max results (optional, default 50)
+                params[0:] or params[1:]: Search query strings
+
+            Returns tuple of "item_name|pack_name|path" strings for matching items,
+            in browser order.
+            """
+            if params and isinstance(params[0], int):
+                max_results = params[0]
+                params = params[1:]
+            else:
+                max_results = 50
+
+            if not params:
+                self.logger.warning("search_multi requires at least one query string")
+                return ()
+
+            queries = [str(query).lower() for query in params]
+
+            self._ensure_index()
+            queries = [query for query in queries if self._may_match(query)]
+
+            pack_count = len(self._pack_records)
+            roots = self._entry_roots
+            matches = (i for i in self._multi_substring_matches(queries) if roots[i] < pack_count)
+            output = tuple(map(self._format_entry, islice(matches, max(max_results, 0))))
+
+            self.logger.info("Found %d items matching %s", len(output), queries)
+            return output
+
+        self.osc_server.add_handler("/live/browser/search_multi", browser_search_multi)
+
         # =============================================================================
         # Load Item by Path
         # =============================================================================
@@ -177,48 +688,34 @@ class BrowserHandler(AbletonOSCHandler):
             path_parts = full_path.split("/")
 
             if len(path_parts) < 2:
-                self.logger.warning("Invalid path format: %s" % full_path)
+                self.logger.warning("Invalid path format: %s", full_path)
                 return (-1,)
 
             pack_name = path_parts[0]
             item_path = path_parts[1:]
 
-            # Find the pack
-            target_pack = None
-            for pack in browser.packs.iter_children:
-                if pack.name == pack_name or pack_name.lower() in pack.name.lower():
-                    target_pack = pack
-                    break
+            self._ensure_index()
+            target_pack = self._find_pack(pack_name)
 
             if not target_pack:
-                self.logger.warning("Pack not found: %s" % pack_name)
+                self.logger.warning("Pack not found: %s", pack_name)
                 return (-1,)
 
             # Navigate to the item
-            current_item = target_pack
-            for i, part in enumerate(item_path):
-                found = False
-                try:
-                    for child in current_item.iter_children:
-                        if child.name == part or part.lower() in child.name.lower():
-                            current_item = child
-                            found = True
-                            break
-                except Exception as e:
-                    self.logger.warning("Error navigating path: %s" % str(e))
-                    return (-1,)
-
-                if not found:
-                    self.logger.warning("Path component not found: %s (in %s)" % (part, full_path))
+            current_record = target_pack
+            for part in item_path:
+                current_record = self._find_child(current_record, part)
+                if current_record is None:
+                    self.logger.warning("Path component not found: %s (in %s)", part, full_path)
                     return (-1,)
 
             # Load the item
-            if current_item.is_loadable:
-                browser.load_item(current_item)
-                self.logger.info("Loaded item: %s" % full_path)
+            if current_record.is_loadable:
+                browser.load_item(current_record.item_ref)
+                self.logger.info("Loaded item: %s", full_path)
                 return (1,)
             else:
-                self.logger.warning("Item is not loadable: %s" % full_path)
+                self.logger.warning("Item is not loadable: %s", full_path)
                 return (-1,)
 
         self.osc_server.add_handler("/live/browser/load_item", browser_load_item)
@@ -244,51 +741,31 @@ class BrowserHandler(AbletonOSCHandler):
 
             query = str(params[0]).lower()
 
-            # Search through all packs
-            for pack in browser.packs.iter_children:
-                result = self._find_and_load(pack, query, 10)
-                if result:
-                    return (result,)
-
-            # Also search standard locations
-            search_locations = [
-                browser.instruments,
-                browser.audio_effects,
-                browser.midi_effects,
-                browser.drums,
-                browser.sounds,
-            ]
-
-            for location in search_locations:
-                result = self._find_and_load(location, query, 10)
-                if result:
-                    return (result,)
+            result = self._find_and_load(query, 10)
+            if result:
+                return (result,)
 
-            self.logger.warning("No item found matching: %s" % query)
+            self.logger.warning("No item found matching: %s", query)
             return ("",)
 
-        def _find_and_load(item, query, depth):
-            """Recursively find and load first matching item."""
-            if depth <= 0:
+        def _find_and_load(query, depth):
+            """Find and load the first indexed item matching query.
+
+            Packs are searched before the standard browser locations.
+            """
+            self._ensure_index()
+            if not self._may_match(query):
                 return None
 
-            try:
-                for child in item.iter_children:
-                    # Check if this item matches
-                    if child.is_loadable and query in child.name.lower():
-                        browser.load_item(child)
-                        self.logger.info("Found and loaded: %s" % child.name)
-                        return child.name
-
-                    # Recurse into folders
-                    if child.is_folder:
-                        result = _find_and_load(child, query, depth - 1)
-                        if result:
-                            return result
-            except Exception as e:
-                self.logger.debug("Error searching: %s" % str(e))
+            depths = self._entry_depths
+            hit = next(filter(lambda i: depths[i] <= depth, self._substring_matches(query)), None)
+            if hit is None:
+                return None
 
-            return None
+            record = self._entry_records[hit]
+            browser.load_item(record.item_ref)
+            self.logger.info("Found and loaded: %s", record.name)
+            return record.name
 
         self._find_and_load = _find_and_load
         self.osc_server.add_handler("/live/browser/search_and_load", browser_search_and_load)
@@ -299,61 +776,32 @@ class BrowserHandler(AbletonOSCHandler):
 
         def browser_list_instruments(_):
             """List top-level items in the instruments browser."""
-            try:
-                items = []
-                for item in browser.instruments.iter_children:
-                    items.append(item.name)
-                return tuple(items)
-            except Exception as e:
-                self.logger.error("Error listing instruments: %s" % str(e))
-                return ()
+            return self._list_top_level("instruments", browser.instruments, "instruments")
 
         def browser_list_audio_effects(_):
             """List top-level items in the audio effects browser."""
-            try:
-                items = []
-                for item in browser.audio_effects.iter_children:
-                    items.append(item.name)
-                return tuple(items)
-            except Exception as e:
-                self.logger.error("Error listing audio effects: %s" % str(e))
-                return ()
+            return self._list_top_level("audio_effects", browser.audio_effects, "audio effects")
 
         def browser_list_midi_effects(_):
             """List top-level items in the MIDI effects browser."""
-            try:
-                items = []
-                for item in browser.midi_effects.iter_children:
-                    items.append(item.name)
-                return tuple(items)
-            except Exception as e:
-                self.logger.error("Error listing MIDI effects: %s" % str(e))
-                return ()
+            return self._list_top_level("midi_effects", browser.midi_effects, "MIDI effects")
 
         def browser_list_drums(_):
             """List top-level items in the drums browser."""
-            try:
-                items = []
-                for item in browser.drums.iter_children:
-                    items.append(item.name)
-                return tuple(items)
-            except Exception as e:
-                self.logger.error("Error listing drums: %s" % str(e))
-                return ()
+            return self._list_top_level("drums", browser.drums, "drums")
 
         def browser_list_sounds(_):
             """List top-level items in the sounds browser."""
-            try:
-                items = []
-                for item in browser.sounds.iter_children:
-                    items.append(item.name)
-                return tuple(items)
-            except Exception as e:
-                self.logger.error("Error listing sounds: %s" % str(e))
-                return ()
+            return self._list_top_level("sounds", browser.sounds, "sounds")
 
         self.osc_server.add_handler("/live/browser/list_instruments", browser_list_instruments)
         self.osc_server.add_handler("/live/browser/list_audio_effects", browser_list_audio_effects)
         self.osc_server.add_handler("/live/browser/list_midi_effects", browser_list_midi_effects)
         self.osc_server.add_handler("/live/browser/list_drums", browser_list_drums)
         self.osc_server.add_handler("/live/browser/list_sounds", browser_list_sounds)
+
+    def clear_api(self):
+        super().clear_api()
+        # Abandon any background index build, so that its scheduled steps stop
+        # rather than carrying on alongside the reloaded handler's build
+        self._index_builder = None
@@ -0,0 +1,62 @@
+from . import client, wait_one_tick
+
+#--------------------------------------------------------------------------------
+# Test browser features
+#--------------------------------------------------------------------------------
+
+# Indexing a large library can take several ticks
+INDEX_TIMEOUT = 30.0
+
+def test_browser_refresh(client):
+    rv = client.query("/live/browser/refresh", timeout=INDEX_TIMEOUT)
+    assert len(rv) == 1 and rv[0] >= 0
+
+def test_browser_search(client):
+    rv = client.query("/live/browser/search", ("a", 5), timeout=INDEX_TIMEOUT)
+    assert len(rv) <= 5
+    for result in rv:
+        item_name, pack_name, path = result.split("|")
+        assert "a" in item_name.lower()
+        assert path.startswith(pack_name + "/")
+        assert path.endswith("/" + item_name)
+
+def test_browser_search_ranking(client):
+    query = "bass"
+    rv = client.query("/live/browser/search", (query, 1000), timeout=INDEX_TIMEOUT)
+
+    def tier(item_name):
+        if item_name.startswith(query):
+            return 0
+        if " " + query in item_name:
+            return 1
+        return 2
+
+    tiers = [tier(result.split("|")[0].lower()) for result in rv]
+    assert tiers == sorted(tiers)
+
+def test_browser_search_no_match(client):
+    rv = client.query("/live/browser/search", ("zzqqxxnotapreset",), timeout=INDEX_TIMEOUT)
+    assert rv == ()
+
+def test_browser_invalidate_cache(client):
+    rv = client.query("/live/browser/list_instruments")
+    assert all(isinstance(name, str) for name in rv)
+
+    # Invalidating is accepted, and the listing can still be read afterwards
+    client.send_message("/live/browser/invalidate_cache")
+    wait_one_tick()
+    assert client.query("/live/browser/list_instruments") == rv
+
+def test_browser_search_multi(client):
+    rv = client.query("/live/browser/search_multi", (10, "bass", "kick"), timeout=INDEX_TIMEOUT)
+    assert len(rv) <= 10
+    for result in rv:
+        item_name, pack_name, path = result.split("|")
+        assert "bass" in item_name.lower() or "kick" in item_name.lower()
+
+def test_browser_search_multi_default_limit(client):
+    rv = client.query("/live/browser/search_multi", ("bass", "kick"), timeout=INDEX_TIMEOUT)
+    assert len(rv) <= 50
+    for result in rv:
+        item_name, pack_name, path = result.split("|")
+        assert "bass" in item_name.lower() or "kick" in item_name.lower()